@@ -3,6 +3,7 @@ from .models import (
     User,
     ClientProfile,
     FreelancerProfile,
+    Skill,
     Project,
     Proposal,
     Contract,
@@ -13,6 +14,7 @@ from .models import (
 # ---------- Register Models ----------
 admin.site.register(User)
 admin.site.register(ClientProfile)
+admin.site.register(Skill)
 admin.site.register(FreelancerProfile)
 admin.site.register(Project)
 admin.site.register(Proposal)
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.6 on 2026-10-14 18:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_contract_rating_contract_review'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contract',
+            index=models.Index(fields=['client', '-created_at'], name='accounts_co_client__de5751_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contract',
+            index=models.Index(fields=['freelancer', '-created_at'], name='accounts_co_freelan_1ba1a9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['contract', 'timestamp'], name='accounts_me_contrac_af03c5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'is_read', '-created_at'], name='accounts_no_user_id_b29cd4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['project', 'status'], name='accounts_pr_project_067dfe_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['freelancer', 'status'], name='accounts_pr_freelan_e05c86_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.db import migrations
+
+
+# Django compiles skills__icontains to UPPER("skills"::text) LIKE UPPER(%s) on
+# PostgreSQL, so the trigram index is built on that same expression.
+def create_skills_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS freelancer_skills_trgm '
+        'ON accounts_freelancerprofile USING gin (UPPER(skills::text) gin_trgm_ops)'
+    )
+
+
+def drop_skills_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS freelancer_skills_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_add_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_skills_trigram_index, drop_skills_trigram_index),
+    ]
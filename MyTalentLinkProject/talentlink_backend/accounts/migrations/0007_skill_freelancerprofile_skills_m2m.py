@@ -0,0 +1,62 @@
+from django.db import migrations, models
+
+
+def split_skills(apps, schema_editor):
+    """
+    Turn each profile's comma-separated skills string into Skill rows.
+    """
+    FreelancerProfile = apps.get_model('accounts', 'FreelancerProfile')
+    Skill = apps.get_model('accounts', 'Skill')
+    for profile in FreelancerProfile.objects.exclude(skills_text='').iterator(chunk_size=500):
+        names = {name.strip().lower()[:64] for name in profile.skills_text.split(',')}
+        names.discard('')
+        skills = [Skill.objects.get_or_create(name=name)[0] for name in names]
+        profile.skills.set(skills)
+
+
+def join_skills(apps, schema_editor):
+    FreelancerProfile = apps.get_model('accounts', 'FreelancerProfile')
+    for profile in FreelancerProfile.objects.prefetch_related('skills'):
+        profile.skills_text = ', '.join(skill.name for skill in profile.skills.all())[:255]
+        profile.save(update_fields=['skills_text'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_freelancer_skills_trigram_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.RenameField(
+            model_name='freelancerprofile',
+            old_name='skills',
+            new_name='skills_text',
+        ),
+        # A default lets the reverse of RemoveField re-add the column on populated tables
+        migrations.AlterField(
+            model_name='freelancerprofile',
+            name='skills_text',
+            field=models.CharField(default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='freelancerprofile',
+            name='skills',
+            field=models.ManyToManyField(blank=True, related_name='freelancers', to='accounts.skill'),
+        ),
+        migrations.RunPython(split_skills, join_skills),
+        migrations.RemoveField(
+            model_name='freelancerprofile',
+            name='skills_text',
+        ),
+    ]
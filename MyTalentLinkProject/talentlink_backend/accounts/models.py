@@ -1,6 +1,8 @@
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
+from django.db.models import F
+from django.db.models.functions import Greatest
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
@@ -8,6 +10,8 @@ from django.dispatch import receiver
 class User(AbstractUser):
     is_client = models.BooleanField(default=False)
     is_freelancer = models.BooleanField(default=False)
+    # Denormalized count of unread notifications, kept in sync by adjust_unread_notifications()
+    unread_notifications = models.PositiveIntegerField(default=0)
 
     groups = models.ManyToManyField(
         'auth.Group',
@@ -40,11 +44,22 @@ class ClientProfile(models.Model):
         return self.company_name
 
 
+# ---------- Skill ----------
+class Skill(models.Model):
+    name = models.CharField(max_length=64, unique=True)  # stored lowercased
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+
 # ---------- Freelancer Profile ----------
 class FreelancerProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
     portfolio = models.TextField(blank=True)
-    skills = models.CharField(max_length=255)
+    skills = models.ManyToManyField(Skill, related_name="freelancers", blank=True)
     hourly_rate = models.DecimalField(max_digits=6, decimal_places=2)
     availability = models.BooleanField(default=True)
 
@@ -76,6 +91,12 @@ class Proposal(models.Model):
     status = models.CharField(max_length=20, default="Pending")  # Pending / Accepted / Rejected
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["project", "status"]),
+            models.Index(fields=["freelancer", "status"]),
+        ]
+
     def __str__(self):
         return f"Proposal by {self.freelancer.username} for {self.project.title}"
 
@@ -83,6 +104,8 @@ class Proposal(models.Model):
 # ---------- Contract ----------
 class Contract(models.Model):
     proposal = models.OneToOneField(Proposal, on_delete=models.CASCADE, related_name='contract')
+    # Denormalized from proposal.project.client / proposal.freelancer so contract
+    # lists filter on indexed local columns; save() keeps them in sync.
     client = models.ForeignKey(User, on_delete=models.CASCADE, related_name='client_contracts')
     freelancer = models.ForeignKey(User, on_delete=models.CASCADE, related_name='freelancer_contracts')
     payment_amount = models.DecimalField(max_digits=10, decimal_places=2)
@@ -101,6 +124,33 @@ class Contract(models.Model):
     rating = models.PositiveSmallIntegerField(null=True, blank=True)  
     review = models.TextField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["client", "-created_at"]),
+            models.Index(fields=["freelancer", "-created_at"]),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored status so receivers can detect real transitions
+        instance._loaded_status = instance.__dict__.get("status")
+        return instance
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        # Re-derive the parties only when they (or the proposal) are being written;
+        # partial saves like update_fields=["rating"] must not fetch proposal/project
+        if update_fields is None or {"proposal", "client", "freelancer"} & set(update_fields):
+            self.client_id = self.proposal.project.client_id
+            self.freelancer_id = self.proposal.freelancer_id
+            if update_fields is not None:
+                kwargs["update_fields"] = set(update_fields) | {"client", "freelancer"}
+        super().save(*args, **kwargs)
+        # Only a save that writes status changes what is stored
+        if update_fields is None or "status" in update_fields:
+            self._loaded_status = self.status
+
     def __str__(self):
         return f"Contract: {self.proposal.project.title} ({self.status})"
 
@@ -117,6 +167,9 @@ class Message(models.Model):
 
     class Meta:
         ordering = ["timestamp"]
+        indexes = [
+            models.Index(fields=["contract", "timestamp"]),
+        ]
 
     def __str__(self):
         return f"Message from {self.sender.username} to {self.receiver.username} at {self.timestamp}"
@@ -156,59 +209,61 @@ class Notification(models.Model):
         ordering = ["-created_at"]
         verbose_name = "Notification"
         verbose_name_plural = "Notifications"
+        indexes = [
+            models.Index(fields=["user", "is_read", "-created_at"]),
+        ]
 
     def __str__(self):
         return f"[{self.notification_type.upper()}] {self.message[:50]} → {self.user.username}"
 
 
-# ---------- Signals ----------
-@receiver(post_save, sender=Proposal)
-def create_contract_on_accept(sender, instance, **kwargs):
-    """
-    Automatically create a contract when a proposal is accepted.
+def adjust_unread_notifications(user_id, delta):
     """
-    if instance.status == 'Accepted' and not hasattr(instance, 'contract'):
-        Contract.objects.create(
-            proposal=instance,
-            client=instance.project.client,
-            freelancer=instance.freelancer,
-            payment_amount=instance.bid_amount,
-            status='Active'
-        )
-
-
-@receiver(post_save, sender=Message)
-def create_notification_on_message(sender, instance, created, **kwargs):
+    Atomically add delta (negative to decrement) to a user's unread counter.
     """
-    Automatically create a notification when a new message is sent.
-    """
-    if created:
-        Notification.objects.create(
-            user=instance.receiver,
-            message=f"New message from {instance.sender.username}",
-            link=f"/contracts/{instance.contract.id}/chat",
-            notification_type="message"
-        )
+    User.objects.filter(pk=user_id).update(
+        unread_notifications=Greatest(F("unread_notifications") + delta, 0)
+    )
 
 
-@receiver(post_save, sender=Contract)
-def notify_on_contract_status_change(sender, instance, **kwargs):
+def notify_contract_completed(contract):
     """
-    Notify both client and freelancer when a contract is completed.
+    Notify both client and freelancer that a contract has been completed.
     """
-    if instance.status == "Completed":
-        # Notify client
-        Notification.objects.create(
-            user=instance.client,
-            message=f"Your project '{instance.proposal.project.title}' has been marked as completed.",
-            link=f"/contracts/{instance.id}/",
+    title = contract.proposal.project.title
+    link = f"/contracts/{contract.id}/"
+    # One INSERT for both parties; bulk_create skips post_save, so the
+    # unread counters are bumped here instead
+    notifications = [
+        Notification(
+            user=contract.client,
+            message=f"Your project '{title}' has been marked as completed.",
+            link=link,
             notification_type="project"
-        )
-
-        # Notify freelancer
-        Notification.objects.create(
-            user=instance.freelancer,
-            message=f"You have successfully completed the project '{instance.proposal.project.title}'.",
-            link=f"/contracts/{instance.id}/",
+        ),
+        Notification(
+            user=contract.freelancer,
+            message=f"You have successfully completed the project '{title}'.",
+            link=link,
             notification_type="project"
-        )
+        ),
+    ]
+
+    def create_notifications():
+        Notification.objects.bulk_create(notifications)
+        for notification in notifications:
+            adjust_unread_notifications(notification.user_id, 1)
+
+    transaction.on_commit(create_notifications)
+
+
+# ---------- Signals ----------
+@receiver(post_save, sender=Contract, dispatch_uid="contract_notify_completed")
+def notify_on_contract_status_change(sender, instance, update_fields=None, **kwargs):
+    """
+    Notify both client and freelancer when a saved contract becomes completed.
+    """
+    if update_fields is not None and "status" not in update_fields:
+        return
+    if instance.status == "Completed" and getattr(instance, "_loaded_status", None) != "Completed":
+        notify_contract_completed(instance)
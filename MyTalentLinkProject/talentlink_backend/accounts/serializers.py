@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from django.contrib.auth.password_validation import validate_password
+from django.db.models import Prefetch
 from .models import (
     ClientProfile, FreelancerProfile, Project, Proposal,
-    User, Contract, Message, Notification
+    User, Contract, Message, Notification, Skill
 )
 
 # ---------- User Serializers ----------
@@ -41,13 +42,45 @@ class ClientProfileSerializer(serializers.ModelSerializer):
         fields = ['id', 'user', 'company_name', 'bio', 'contact_email']
 
 
+class SkillListField(serializers.Field):
+    """
+    Exposes a skills relation as the comma-separated string the API has always used.
+    """
+    def to_representation(self, value):
+        return ", ".join(skill.name for skill in value.all())
+
+    def to_internal_value(self, data):
+        if not isinstance(data, str):
+            raise serializers.ValidationError("Skills must be a comma-separated string.")
+        names = {name.strip().lower() for name in data.split(",")} - {""}
+        if any(len(name) > 64 for name in names):
+            raise serializers.ValidationError("Each skill must be at most 64 characters.")
+        return sorted(names)
+
+
 class FreelancerProfileSerializer(serializers.ModelSerializer):
     user = serializers.CharField(source='user.username', read_only=True)
+    skills = SkillListField(required=False)
 
     class Meta:
         model = FreelancerProfile
         fields = ['id', 'user', 'portfolio', 'skills', 'hourly_rate', 'availability']
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Join or prefetch every relation this serializer reads, so list views stay N+1-free.
+        """
+        return queryset.select_related('user').prefetch_related('skills')
+
+    def update(self, instance, validated_data):
+        names = validated_data.pop('skills', None)
+        instance = super().update(instance, validated_data)
+        if names is not None:
+            Skill.objects.bulk_create([Skill(name=name) for name in names], ignore_conflicts=True)
+            instance.skills.set(Skill.objects.filter(name__in=names))
+        return instance
+
 
 # ---------- Project Serializer ----------
 class ProjectSerializer(serializers.ModelSerializer):
@@ -61,6 +94,13 @@ class ProjectSerializer(serializers.ModelSerializer):
             'duration', 'created_at', 'updated_at', 'proposals'
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        proposals = ProposalSerializer.setup_eager_loading(Proposal.objects.all())
+        return queryset.select_related('client').prefetch_related(
+            Prefetch('proposals', queryset=proposals)
+        )
+
     def get_proposals(self, obj):
         from .serializers import ProposalSerializer
         proposals = obj.proposals.all()
@@ -77,6 +117,10 @@ class ProposalSerializer(serializers.ModelSerializer):
         fields = ['id', 'project', 'freelancer', 'proposal_text', 'bid_amount', 'status', 'created_at']
         read_only_fields = ['freelancer', 'status', 'created_at']
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return queryset.select_related('freelancer')
+
 
 # ---------- Contract Serializer ----------
 class ContractSerializer(serializers.ModelSerializer):
@@ -104,6 +148,10 @@ class ContractSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at']
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return queryset.select_related('proposal__project', 'client', 'freelancer')
+
 
 
 # ---------- Message Serializer ----------
@@ -120,6 +168,10 @@ class MessageSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'sender', 'timestamp', 'is_read']
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return queryset.select_related('sender', 'receiver')
+
 
 
 # ---------- Notification Serializer ----------
@@ -140,3 +192,8 @@ class NotificationSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'user', 'created_at', 'notification_type']
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return queryset.select_related('user')
+
+
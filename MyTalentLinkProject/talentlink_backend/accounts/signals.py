@@ -1,19 +1,19 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from .models import (
     User, FreelancerProfile, ClientProfile,
-    Proposal, Contract, Message, Notification
+    Proposal, Contract, Notification,
+    adjust_unread_notifications
 )
 
 # ---------- Auto-create profiles ----------
-@receiver(post_save, sender=User)
+@receiver(post_save, sender=User, dispatch_uid="user_create_profile")
 def create_user_profile(sender, instance, created, **kwargs):
     if created:
         if instance.is_freelancer:
             FreelancerProfile.objects.create(
                 user=instance,
                 portfolio="",
-                skills="",
                 hourly_rate=0,
                 availability=True
             )
@@ -27,30 +27,31 @@ def create_user_profile(sender, instance, created, **kwargs):
 
 
 # ---------- Auto-create contract when proposal accepted ----------
-@receiver(post_save, sender=Proposal)
+@receiver(post_save, sender=Proposal, dispatch_uid="proposal_accept_contract")
 def create_contract_on_accept(sender, instance, **kwargs):
     """
     Automatically create a contract when a proposal is accepted.
     """
-    if instance.status == 'Accepted' and not Contract.objects.filter(proposal=instance).exists():
-        Contract.objects.create(
+    if instance.status == 'Accepted':
+        # The OneToOne on proposal is unique, so get_or_create settles concurrent accepts
+        Contract.objects.get_or_create(
             proposal=instance,
-            client=instance.project.client,
-            freelancer=instance.freelancer,
-            payment_amount=instance.bid_amount,
-            status='Active'
+            # Contract.save() fills client and freelancer from the proposal
+            defaults={
+                "payment_amount": instance.bid_amount,
+                "status": "Active"
+            }
         )
 
 
-# ---------- Create notification when a new message is sent ----------
-@receiver(post_save, sender=Message)
-def create_notification_on_message(sender, instance, created, **kwargs):
-    """
-    Automatically notify receiver when a new message is created.
-    """
-    if created:
-        Notification.objects.create(
-            user=instance.receiver,
-            message=f"New message from {instance.sender.username}",
-            link=f"/contracts/{instance.contract.id}/chat"
-        )
+# ---------- Keep the unread notification counter in sync ----------
+@receiver(post_save, sender=Notification, dispatch_uid="notification_count_unread")
+def count_new_unread_notification(sender, instance, created, **kwargs):
+    if created and not instance.is_read:
+        adjust_unread_notifications(instance.user_id, 1)
+
+
+@receiver(post_delete, sender=Notification, dispatch_uid="notification_uncount_unread")
+def uncount_deleted_unread_notification(sender, instance, **kwargs):
+    if not instance.is_read:
+        adjust_unread_notifications(instance.user_id, -1)
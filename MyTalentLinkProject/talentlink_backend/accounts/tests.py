@@ -1,3 +1,171 @@
-from django.test import TestCase
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from .models import User, Project, Proposal, Contract, Notification
+
+
+# ---------- Unread notification counter ----------
+class UnreadNotificationCounterTests(TestCase):
+    """
+    User.unread_notifications is maintained from several write paths;
+    it must always equal the number of unread Notification rows.
+    """
+
+    def setUp(self):
+        self.client_user = User.objects.create(username="client", email="c@example.com", is_client=True)
+        self.freelancer = User.objects.create(username="freelancer", email="f@example.com", is_freelancer=True)
+        project = Project.objects.create(
+            client=self.client_user, title="Site", description="d",
+            category="web", budget=100, duration=7
+        )
+        proposal = Proposal.objects.create(
+            project=project, freelancer=self.freelancer,
+            proposal_text="t", bid_amount=50, status="Accepted"
+        )
+        self.contract = Contract.objects.get(proposal=proposal)
+
+        self.api = {}
+        for user in (self.client_user, self.freelancer):
+            api = APIClient()
+            api.force_authenticate(user)
+            self.api[user.pk] = api
+
+    def assertCounterInSync(self):
+        for user in (self.client_user, self.freelancer):
+            user.refresh_from_db()
+            unread = Notification.objects.filter(user=user, is_read=False).count()
+            self.assertEqual(user.unread_notifications, unread, user.username)
+
+    def test_counter_follows_every_write_path(self):
+        # post_save on create
+        notification = Notification.objects.create(user=self.freelancer, message="Hello")
+        self.assertCounterInSync()
+        self.assertEqual(self.freelancer.unread_notifications, 1)
+
+        # bulk_create on contract completion (runs on commit)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.api[self.client_user.pk].put(
+                f"/api/accounts/contracts/{self.contract.pk}/mark_completed/"
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertCounterInSync()
+        self.assertEqual(self.freelancer.unread_notifications, 2)
+        self.assertEqual(self.client_user.unread_notifications, 1)
+
+        # mark_as_read, including a repeat on an already-read row
+        freelancer_api = self.api[self.freelancer.pk]
+        for _ in range(2):
+            response = freelancer_api.post(f"/api/accounts/notifications/{notification.pk}/mark_as_read/")
+            self.assertEqual(response.status_code, 200)
+            self.assertCounterInSync()
+        self.assertEqual(self.freelancer.unread_notifications, 1)
+
+        # unread_count reads the counter
+        response = freelancer_api.get("/api/accounts/notifications/unread_count/")
+        self.assertEqual(response.data, {"count": 1})
+
+        # mark_all_as_read
+        response = freelancer_api.post("/api/accounts/notifications/mark_all_as_read/")
+        self.assertEqual(response.status_code, 200)
+        self.assertCounterInSync()
+        self.assertEqual(self.freelancer.unread_notifications, 0)
+
+        # post_delete of an unread and a read notification
+        unread = Notification.objects.filter(user=self.client_user, is_read=False).get()
+        unread.delete()
+        notification.delete()
+        self.assertCounterInSync()
+        self.assertEqual(self.client_user.unread_notifications, 0)
+
+
+# ---------- Contract ----------
+class ContractTests(TestCase):
+
+    def setUp(self):
+        self.client_user = User.objects.create(username="client", email="c@example.com", is_client=True)
+        self.freelancer = User.objects.create(username="freelancer", email="f@example.com", is_freelancer=True)
+        self.project = Project.objects.create(
+            client=self.client_user, title="Site", description="d",
+            category="web", budget=100, duration=7
+        )
+        proposal = Proposal.objects.create(
+            project=self.project, freelancer=self.freelancer,
+            proposal_text="t", bid_amount=50, status="Accepted"
+        )
+        self.contract = Contract.objects.get(proposal=proposal)
+
+    def test_mark_completed_rejects_non_party(self):
+        outsider = User.objects.create(username="outsider", email="o@example.com", is_client=True)
+        api = APIClient()
+        api.force_authenticate(outsider)
+
+        response = api.put(f"/api/accounts/contracts/{self.contract.pk}/mark_completed/")
+        self.assertEqual(response.status_code, 404)
+        self.contract.refresh_from_db()
+        self.assertEqual(self.contract.status, "Active")
+        self.assertFalse(Notification.objects.filter(notification_type="project").exists())
+
+    def test_partial_save_skips_party_lookup(self):
+        contract = Contract.objects.get(pk=self.contract.pk)
+        contract.rating = 5
+        with self.assertNumQueries(1):
+            contract.save(update_fields=["rating"])
+
+    def test_completion_notifies_after_earlier_partial_save(self):
+        contract = Contract.objects.get(pk=self.contract.pk)
+        contract.status = "Completed"
+        contract.rating = 5
+        with self.captureOnCommitCallbacks(execute=True):
+            contract.save(update_fields=["rating"])
+        self.assertFalse(Notification.objects.filter(notification_type="project").exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            contract.save()
+        self.assertEqual(Notification.objects.filter(notification_type="project").count(), 2)
+
+    def test_full_save_rederives_parties(self):
+        contract = Contract.objects.get(pk=self.contract.pk)
+        contract.client = self.freelancer
+        contract.save()
+        contract.refresh_from_db()
+        self.assertEqual(contract.client_id, self.client_user.pk)
+
+
+
+class SkillsMigrationTests(TransactionTestCase):
+    """
+    0007 splits the old comma-separated skills string into Skill rows,
+    and reversing it joins them back.
+    """
+    before = [("accounts", "0006_freelancer_skills_trigram_index")]
+    after = [("accounts", "0007_skill_freelancerprofile_skills_m2m")]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_skills_round_trip(self):
+        apps = self.migrate(self.before)
+        HistoricalUser = apps.get_model("accounts", "User")
+        HistoricalProfile = apps.get_model("accounts", "FreelancerProfile")
+        user = HistoricalUser.objects.create(username="dev", is_freelancer=True)
+        profile = HistoricalProfile.objects.create(
+            user=user, skills="Python, Django ,, python", hourly_rate=10
+        )
+
+        apps = self.migrate(self.after)
+        profile = apps.get_model("accounts", "FreelancerProfile").objects.get(pk=profile.pk)
+        self.assertEqual(sorted(profile.skills.values_list("name", flat=True)), ["django", "python"])
+        self.assertEqual(apps.get_model("accounts", "Skill").objects.count(), 2)
+
+        apps = self.migrate(self.before)
+        profile = apps.get_model("accounts", "FreelancerProfile").objects.get(pk=profile.pk)
+        self.assertEqual(profile.skills, "django, python")
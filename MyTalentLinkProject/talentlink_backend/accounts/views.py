@@ -1,8 +1,11 @@
 from django.http import HttpResponse
 from rest_framework import generics, viewsets, permissions, status, filters
 from rest_framework.decorators import action
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
+from django.db import transaction
+from django.db.models import Q
 from django_filters.rest_framework import DjangoFilterBackend
 
 from .models import (
@@ -12,7 +15,8 @@ from .models import (
     Proposal,
     Contract,
     Message,
-    Notification
+    Notification,
+    adjust_unread_notifications
 )
 from .serializers import (
     RegisterSerializer,
@@ -26,11 +30,16 @@ from .serializers import (
 )
 
 # ✅ Helper function to create notifications
-def create_notification(user, message, link=""):
+def create_notification(user, message, link="", notification_type="system"):
     """
-    Creates a notification entry for a specific user.
+    Creates a notification entry for a specific user once the current
+    transaction commits, so a failed notification never rolls back the action.
     """
-    Notification.objects.create(user=user, message=message, link=link)
+    transaction.on_commit(
+        lambda: Notification.objects.create(
+            user=user, message=message, link=link, notification_type=notification_type
+        )
+    )
 
 # ---------- Test View ----------
 def test_view(request):
@@ -49,14 +58,20 @@ class ClientProfileView(generics.RetrieveUpdateAPIView):
     serializer_class = ClientProfileSerializer
 
     def get_object(self):
-        profile, _ = ClientProfile.objects.get_or_create(
-            user=self.request.user,
-            defaults={
-                "company_name": self.request.user.username,
-                "bio": "",
-                "contact_email": self.request.user.email
-            }
-        )
+        user = self.request.user
+        # Fast path: the profile usually exists, so skip get_or_create's transaction
+        try:
+            profile = ClientProfile.objects.get(user_id=user.pk)
+        except ClientProfile.DoesNotExist:
+            profile, _ = ClientProfile.objects.get_or_create(
+                user=user,
+                defaults={
+                    "company_name": user.username,
+                    "bio": "",
+                    "contact_email": user.email
+                }
+            )
+        profile.user = user  # serializer reads user.username; reuse the request's user
         return profile
 
 
@@ -66,33 +81,43 @@ class FreelancerProfileView(generics.RetrieveUpdateAPIView):
     serializer_class = FreelancerProfileSerializer
 
     def get_object(self):
-        profile, _ = FreelancerProfile.objects.get_or_create(
-            user=self.request.user,
-            defaults={
-                "portfolio": "",
-                "skills": "",
-                "hourly_rate": 0,
-                "availability": True
-            }
-        )
+        user = self.request.user
+        # Fast path: the profile usually exists, so skip get_or_create's transaction
+        try:
+            profile = FreelancerProfile.objects.get(user_id=user.pk)
+        except FreelancerProfile.DoesNotExist:
+            profile, _ = FreelancerProfile.objects.get_or_create(
+                user=user,
+                defaults={
+                    "portfolio": "",
+                    "hourly_rate": 0,
+                    "availability": True
+                }
+            )
+        profile.user = user  # serializer reads user.username; reuse the request's user
         return profile
 
 
 # ---------- Freelancer List ----------
 class FreelancerListView(generics.ListAPIView):
-    queryset = FreelancerProfile.objects.all()
+    # Load only the columns FreelancerProfileSerializer renders
+    queryset = FreelancerProfileSerializer.setup_eager_loading(FreelancerProfile.objects.all()).only(
+        'id', 'portfolio', 'hourly_rate', 'availability', 'user__username'
+    )
     serializer_class = FreelancerProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         queryset = super().get_queryset()
-        skills = self.request.query_params.get("skills__icontains")
+        skills = self.request.query_params.get("skills")
         min_rate = self.request.query_params.get("hourly_rate__gte")
         max_rate = self.request.query_params.get("hourly_rate__lte")
         availability = self.request.query_params.get("availability")
 
         if skills:
-            queryset = queryset.filter(skills__icontains=skills)
+            # Comma-separated terms; a freelancer matches if they have any of them
+            terms = {term.strip().lower() for term in skills.split(",")} - {""}
+            queryset = queryset.filter(skills__name__in=terms).distinct()
         if min_rate:
             queryset = queryset.filter(hourly_rate__gte=min_rate)
         if max_rate:
@@ -113,10 +138,11 @@ class ProjectViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
-        if hasattr(user, "is_client") and user.is_client:
-            return Project.objects.filter(client=user).prefetch_related('proposals')
-        elif hasattr(user, "is_freelancer") and user.is_freelancer:
-            return Project.objects.all().prefetch_related('proposals')
+        projects = self.serializer_class.setup_eager_loading(Project.objects.all())
+        if user.is_authenticated and user.is_client:
+            return projects.filter(client=user)
+        elif user.is_authenticated and user.is_freelancer:
+            return projects
         return Project.objects.none()
 
     def perform_create(self, serializer):
@@ -137,10 +163,11 @@ class ProposalViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
-        if hasattr(user, "is_client") and user.is_client:
-            return Proposal.objects.filter(project__client=user)
-        elif hasattr(user, "is_freelancer") and user.is_freelancer:
-            return Proposal.objects.filter(freelancer=user)
+        proposals = self.serializer_class.setup_eager_loading(Proposal.objects.all())
+        if user.is_authenticated and user.is_client:
+            return proposals.filter(project__client=user)
+        elif user.is_authenticated and user.is_freelancer:
+            return proposals.filter(freelancer=user)
         return Proposal.objects.none()
 
     def perform_create(self, serializer):
@@ -149,7 +176,7 @@ class ProposalViewSet(viewsets.ModelViewSet):
         create_notification(
             user=proposal.project.client,
             message=f"New proposal submitted for your project '{proposal.project.title}'.",
-            link=f"/projects/{proposal.project.id}/"
+            link=f"/projects/{proposal.project_id}/"
         )
 
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])
@@ -157,18 +184,16 @@ class ProposalViewSet(viewsets.ModelViewSet):
         proposal = self.get_object()
         if proposal.project.client != request.user:
             return Response({"error": "Not allowed"}, status=status.HTTP_403_FORBIDDEN)
-        if proposal.status != "Pending":
+        updated = Proposal.objects.filter(pk=proposal.pk, status="Pending").update(status="Accepted")
+        if not updated:
             return Response({"error": "Proposal not pending"}, status=status.HTTP_400_BAD_REQUEST)
-
         proposal.status = "Accepted"
-        proposal.save()
 
-        # Create or fetch a contract
+        # Create or fetch a contract (update() bypasses the post_save receiver)
         contract, _ = Contract.objects.get_or_create(
             proposal=proposal,
+            # Contract.save() fills client and freelancer from the proposal
             defaults={
-                "client": proposal.project.client,
-                "freelancer": proposal.freelancer,
                 "payment_amount": proposal.bid_amount,
                 "status": "Active"
             }
@@ -192,7 +217,7 @@ from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
-from .models import Contract, Notification
+from .models import Contract, Notification, notify_contract_completed
 from .serializers import ContractSerializer
 
 
@@ -200,7 +225,7 @@ class ContractViewSet(viewsets.ModelViewSet):
     """
     Handles all CRUD operations for contracts
     """
-    queryset = Contract.objects.all().order_by('-created_at')
+    queryset = ContractSerializer.setup_eager_loading(Contract.objects.all()).order_by('-created_at')
     serializer_class = ContractSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -210,31 +235,29 @@ class ContractViewSet(viewsets.ModelViewSet):
         Freelancers see their own contracts.
         """
         user = self.request.user
-        if getattr(user, "is_client", False):
-            return Contract.objects.filter(client=user)
-        elif getattr(user, "is_freelancer", False):
-            return Contract.objects.filter(freelancer=user)
+        if user.is_authenticated and user.is_client:
+            return self.queryset.filter(client=user)
+        elif user.is_authenticated and user.is_freelancer:
+            return self.queryset.filter(freelancer=user)
         return Contract.objects.none()
 
     # ✅ Mark a contract as completed
     @action(detail=True, methods=['put'], url_path='mark_completed')
     def mark_completed(self, request, pk=None):
         """
-        Mark a contract as completed and notify the freelancer.
+        Mark a contract as completed and notify both client and freelancer.
         """
-        contract = get_object_or_404(Contract, pk=pk)
+        # Scoped to the requester's own contracts via get_queryset()
+        contract = self.get_object()
 
-        if contract.status == 'Completed':
+        # Narrow UPDATE; the status guard also covers concurrent completions
+        updated = Contract.objects.filter(pk=pk).exclude(status='Completed').update(status='Completed')
+        if not updated:
             return Response({'detail': 'Contract already completed.'}, status=status.HTTP_400_BAD_REQUEST)
 
+        # ✅ update() skips post_save, so notify client and freelancer explicitly
         contract.status = 'Completed'
-        contract.save()
-
-        # ✅ Create notification for freelancer
-        Notification.objects.create(
-            user=contract.freelancer,
-            message=f"🎉 Your contract for '{contract.proposal.project.title}' has been marked as completed!"
-        )
+        notify_contract_completed(contract)
 
         serializer = self.get_serializer(contract)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -245,7 +268,7 @@ class ContractViewSet(viewsets.ModelViewSet):
         """
         Allow client to submit a review and rating once contract is completed.
         """
-        contract = get_object_or_404(Contract, pk=pk)
+        contract = get_object_or_404(self.queryset, pk=pk)
 
         # Only client can review
         if request.user != contract.client:
@@ -272,37 +295,57 @@ class ContractViewSet(viewsets.ModelViewSet):
         # Save review
         contract.rating = rating
         contract.review = review
-        contract.save()
+        contract.save(update_fields=["rating", "review"])
 
         # ✅ Notify freelancer
-        Notification.objects.create(
+        create_notification(
             user=contract.freelancer,
             message=f"⭐ You received a {rating}-star review from {contract.client.username}!"
         )
 
         return Response({"message": "Review submitted successfully ✅"})
 
+# ---------- Pagination ----------
+class MessagePagination(CursorPagination):
+    # Newest first, so the first page is the latest part of a chat
+    page_size = 50
+    ordering = '-timestamp'
+
+
+class NotificationPagination(CursorPagination):
+    page_size = 50
+    ordering = '-created_at'
+
+
 # ---------- Message ViewSet ----------
 class MessageViewSet(viewsets.ModelViewSet):
     serializer_class = MessageSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = MessagePagination
+    filterset_fields = ['contract']
 
     def get_queryset(self):
         user = self.request.user
-        return Message.objects.filter(contract__client=user) | Message.objects.filter(contract__freelancer=user)
+        messages = Message.objects.filter(Q(contract__client=user) | Q(contract__freelancer=user))
+        return self.serializer_class.setup_eager_loading(messages)
 
     def perform_create(self, serializer):
         message = serializer.save(sender=self.request.user)
+        # One JOINed lookup for everything the notification needs
+        contract = Contract.objects.select_related(
+            'client', 'freelancer', 'proposal__project'
+        ).get(pk=message.contract_id)
         # Notify the recipient
         recipient = (
-            message.contract.freelancer
-            if message.sender == message.contract.client
-            else message.contract.client
+            contract.freelancer
+            if message.sender_id == contract.client_id
+            else contract.client
         )
         create_notification(
             user=recipient,
-            message=f"New message in your contract chat for '{message.contract.proposal.project.title}'.",
-            link=f"/contracts/{message.contract.id}/messages/"
+            message=f"New message in your contract chat for '{contract.proposal.project.title}'.",
+            link=f"/contracts/{contract.id}/messages/",
+            notification_type="message"
         )
 
 
@@ -314,48 +357,75 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
     """
     serializer_class = NotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = NotificationPagination
 
     def get_queryset(self):
         """
         Fetch notifications for the currently authenticated user only.
         """
-        return Notification.objects.filter(user=self.request.user).order_by('-created_at')
+        notifications = Notification.objects.filter(user=self.request.user).order_by('-created_at')
+        return self.serializer_class.setup_eager_loading(notifications)
 
     @action(detail=False, methods=["get"])
     def unread(self, request):
         """
         Get all unread notifications for the logged-in user.
         """
-        unread_notifications = self.get_queryset().filter(is_read=False)
+        unread_notifications = self.paginate_queryset(self.get_queryset().filter(is_read=False))
         serializer = self.get_serializer(unread_notifications, many=True)
-        return Response(serializer.data)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=["get"])
+    def list_lite(self, request):
+        """
+        Get the logged-in user's notifications as plain rows, skipping model
+        instances and the serializer.
+        """
+        notifications = self.get_queryset().values(
+            "id", "message", "link", "notification_type", "is_read", "created_at"
+        )
+        page = self.paginate_queryset(notifications)
+        return self.get_paginated_response(page)
+
+    @action(detail=False, methods=["get"])
+    def unread_count(self, request):
+        """
+        Get the number of unread notifications, e.g. for a badge.
+        """
+        # Denormalized on the user row, which authentication has already loaded
+        return Response({"count": request.user.unread_notifications})
 
     @action(detail=False, methods=["get"])
     def read(self, request):
         """
         Get all read notifications for the logged-in user.
         """
-        read_notifications = self.get_queryset().filter(is_read=True)
+        read_notifications = self.paginate_queryset(self.get_queryset().filter(is_read=True))
         serializer = self.get_serializer(read_notifications, many=True)
-        return Response(serializer.data)
+        return self.get_paginated_response(serializer.data)
 
     @action(detail=True, methods=["post"])
     def mark_as_read(self, request, pk=None):
         """
         Mark a single notification as read.
         """
-        try:
-            notification = self.get_queryset().get(pk=pk)
-            notification.is_read = True
-            notification.save()
-            return Response({"message": "Notification marked as read ✅"})
-        except Notification.DoesNotExist:
+        notifications = self.get_queryset().filter(pk=pk)
+        # Single UPDATE in the common case; only check existence when nothing changed
+        with transaction.atomic():
+            updated = notifications.filter(is_read=False).update(is_read=True)
+            if updated:
+                adjust_unread_notifications(request.user.pk, -updated)
+        if not updated and not notifications.exists():
             return Response({"error": "Notification not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response({"message": "Notification marked as read ✅"})
 
     @action(detail=False, methods=["post"])
     def mark_all_as_read(self, request):
         """
         Mark all notifications as read for the logged-in user.
         """
-        updated_count = self.get_queryset().filter(is_read=False).update(is_read=True)
+        with transaction.atomic():
+            updated_count = self.get_queryset().filter(is_read=False).update(is_read=True)
+            if updated_count:
+                adjust_unread_notifications(request.user.pk, -updated_count)
         return Response({"message": f"{updated_count} notifications marked as read ✅"})
@@ -20,7 +20,7 @@ function FindFreelancers() {
     try {
       let query = [];
       if (appliedFilters.skills)
-        query.push(`skills__icontains=${appliedFilters.skills}`);
+        query.push(`skills=${appliedFilters.skills}`);
       if (appliedFilters.minRate)
         query.push(`hourly_rate__gte=${appliedFilters.minRate}`);
       if (appliedFilters.maxRate)
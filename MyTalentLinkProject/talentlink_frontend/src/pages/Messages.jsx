@@ -8,6 +8,8 @@ function Messages() {
   const [contracts, setContracts] = useState([]);
   const [loading, setLoading] = useState(true);
   const [messages, setMessages] = useState({});
+  const [olderPages, setOlderPages] = useState({}); // cursor URL for older messages, per contract
+  const [loadingOlder, setLoadingOlder] = useState(null);
   const [newMessage, setNewMessage] = useState({});
   const [currentUser, setCurrentUser] = useState(null);
   const [showEmojiPicker, setShowEmojiPicker] = useState(null); // Track open picker per contract
@@ -48,12 +50,35 @@ function Messages() {
   const fetchMessages = async (contractId) => {
     try {
       const res = await API.get(`messages/?contract=${contractId}`);
-      setMessages((prev) => ({ ...prev, [contractId]: res.data }));
+      // Pages arrive newest first; show the latest page oldest-to-newest
+      const latest = [...res.data.results].reverse();
+      setMessages((prev) => ({ ...prev, [contractId]: latest }));
+      setOlderPages((prev) => ({ ...prev, [contractId]: res.data.next }));
     } catch (err) {
       console.error("Error fetching messages:", err);
     }
   };
 
+  // ✅ Load the next (older) page of a contract's messages
+  const loadOlderMessages = async (contractId) => {
+    const nextPage = olderPages[contractId];
+    if (!nextPage) return;
+    try {
+      setLoadingOlder(contractId);
+      const res = await API.get(nextPage);
+      const older = [...res.data.results].reverse();
+      setMessages((prev) => ({
+        ...prev,
+        [contractId]: [...older, ...(prev[contractId] || [])],
+      }));
+      setOlderPages((prev) => ({ ...prev, [contractId]: res.data.next }));
+    } catch (err) {
+      console.error("Error loading older messages:", err);
+    } finally {
+      setLoadingOlder(null);
+    }
+  };
+
   // ✅ Helper to get receiver ID for each contract
   const getReceiverId = (contractId) => {
     const contract = contracts.find((c) => c.id === contractId);
@@ -137,6 +162,16 @@ function Messages() {
                 <h4>Conversation</h4>
 
                 <div className={styles.messageList}>
+                  {olderPages[contract.id] && (
+                    <button
+                      type="button"
+                      className={styles.loadOlderBtn}
+                      onClick={() => loadOlderMessages(contract.id)}
+                      disabled={loadingOlder === contract.id}
+                    >
+                      {loadingOlder === contract.id ? "Loading..." : "Load older messages"}
+                    </button>
+                  )}
                   {messages[contract.id] && messages[contract.id].length > 0 ? (
                     messages[contract.id].map((msg) => (
                       <div
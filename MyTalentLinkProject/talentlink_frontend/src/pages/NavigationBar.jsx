@@ -20,14 +20,13 @@ function NavigationBar() {
   const fetchUnreadNotifications = async () => {
     try {
       const token = localStorage.getItem("access_token");
-      const res = await fetch("http://127.0.0.1:8000/api/accounts/notifications/", {
+      const res = await fetch("http://127.0.0.1:8000/api/accounts/notifications/unread_count/", {
         headers: {
           Authorization: `Bearer ${token}`,
         },
       });
       const data = await res.json();
-      const unread = data.filter((n) => !n.is_read).length;
-      setUnreadCount(unread);
+      setUnreadCount(data.count);
     } catch (error) {
       console.error("Error fetching notifications:", error);
     }
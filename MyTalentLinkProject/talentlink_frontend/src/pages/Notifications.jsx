@@ -8,6 +8,8 @@ function Notifications() {
   const [loading, setLoading] = useState(true);
   const [userRole, setUserRole] = useState(null); // 👈 client/freelancer
   const [marking, setMarking] = useState(null);
+  const [nextPage, setNextPage] = useState(null); // cursor URL for older notifications
+  const [loadingMore, setLoadingMore] = useState(false);
 
   // ✅ Fetch current user (detects if client or freelancer)
   const fetchUser = async () => {
@@ -41,7 +43,8 @@ function Notifications() {
   const fetchNotifications = async () => {
     try {
       const res = await API.get("notifications/");
-      setNotifications(res.data);
+      setNotifications(res.data.results);
+      setNextPage(res.data.next);
     } catch (err) {
       console.error("❌ Failed to fetch notifications:", err);
       alert("Failed to load notifications.");
@@ -50,6 +53,21 @@ function Notifications() {
     }
   };
 
+  // ✅ Load the next (older) page of notifications
+  const loadMore = async () => {
+    if (!nextPage) return;
+    try {
+      setLoadingMore(true);
+      const res = await API.get(nextPage);
+      setNotifications((prev) => [...prev, ...res.data.results]);
+      setNextPage(res.data.next);
+    } catch (err) {
+      console.error("❌ Failed to load more notifications:", err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   // ✅ Mark notification as read
   const markAsRead = async (id) => {
     try {
@@ -130,6 +148,16 @@ function Notifications() {
             ))}
           </div>
         )}
+
+        {nextPage && (
+          <button
+            className={styles.loadMoreBtn}
+            onClick={loadMore}
+            disabled={loadingMore}
+          >
+            {loadingMore ? "Loading..." : "Load more"}
+          </button>
+        )}
       </div>
     </div>
   );